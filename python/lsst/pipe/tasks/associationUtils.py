@@ -108,11 +108,11 @@ def eq2xyzVec(ra, dec):
 
     Returns
     -------
-    vec : `numpy.ndarray`, (N,3)
-        Array of unitsphere 3-vectors.
+    vec : `numpy.ndarray`, (3,N)
+        Array of unitsphere 3-vectors, one per column.
     """
-    ra = np.array(ra, dtype='f8', ndmin=1, copy=False)
-    dec = np.array(dec, dtype='f8', ndmin=1, copy=False)
+    ra = np.atleast_1d(np.asarray(ra, dtype='f8'))
+    dec = np.atleast_1d(np.asarray(dec, dtype='f8'))
     if ra.size != dec.size:
         raise ValueError("ra,dec not same size: %s,%s" % (ra.size, dec.size))
 
@@ -21,6 +21,8 @@
 
 __all__ = ["CoaddBaseTask", "makeSkyInfo"]
 
+import functools
+
 import lsst.pex.config as pexConfig
 import lsst.afw.image as afwImage
 import lsst.pipe.base as pipeBase
@@ -80,6 +82,7 @@ class CoaddBaseTask(pipeBase.PipelineTask):
         super().__init__(**kwargs)
         self.makeSubtask("select")
         self.makeSubtask("inputRecorder")
+        self._badPixelMask = None
 
     def getTempExpDatasetName(self, warpType="direct"):
         """Return warp name for given warpType and task config
@@ -97,8 +100,13 @@ class CoaddBaseTask(pipeBase.PipelineTask):
 
     def getBadPixelMask(self):
         """Convenience method to provide the bitmask from the mask plane names
+
+        The bitmask is computed on first use and cached; the config is frozen
+        once the task has been constructed.
         """
-        return afwImage.Mask.getPlaneBitMask(self.config.badMaskPlanes)
+        if self._badPixelMask is None:
+            self._badPixelMask = afwImage.Mask.getPlaneBitMask(self.config.badMaskPlanes)
+        return self._badPixelMask
 
 
 def makeSkyInfo(skyMap, tractId, patchId):
@@ -133,11 +141,7 @@ def makeSkyInfo(skyMap, tractId, patchId):
     """
     tractInfo = skyMap[tractId]
 
-    if isinstance(patchId, str) and ',' in patchId:
-        #  patch format is "xIndex,yIndex"
-        patchIndex = tuple(int(i) for i in patchId.split(","))
-    else:
-        patchIndex = patchId
+    patchIndex = _parsePatchString(patchId) if isinstance(patchId, str) else patchId
 
     patchInfo = tractInfo.getPatchInfo(patchIndex)
 
@@ -150,6 +154,29 @@ def makeSkyInfo(skyMap, tractId, patchId):
     )
 
 
+@functools.lru_cache(maxsize=512)
+def _parsePatchString(patchId):
+    """Parse a Gen2-style patch string into a patch index.
+
+    Parsed values are cached, since the same handful of patch strings recur
+    across every dataset of a tract.
+
+    Parameters
+    ----------
+    patchId : `str`
+        Patch identifier, e.g. '4,5'.
+
+    Returns
+    -------
+    patchIndex : `tuple` of `int` or `str`
+        Tuple of integers if ``patchId`` is of the form "xIndex,yIndex";
+        otherwise ``patchId`` unchanged.
+    """
+    if ',' in patchId:
+        return tuple(int(i) for i in patchId.split(","))
+    return patchId
+
+
 def scaleVariance(maskedImage, maskPlanes, log=None):
     """Scale the variance in a maskedImage
 
@@ -204,12 +231,12 @@ def reorderAndPadList(inputList, inputKeys, outputKeys, padWith=None):
         Copy of inputList reordered per outputKeys and padded with `padWith`
         so that the length matches length of outputKeys.
     """
-    outputList = []
-    for d in outputKeys:
-        if d in inputKeys:
-            outputList.append(inputList[inputKeys.index(d)])
-        else:
-            outputList.append(padWith)
+    # Map each key to the position of its first occurrence, matching the
+    # semantics of list.index.
+    inputIndices = {}
+    for i, key in enumerate(inputKeys):
+        inputIndices.setdefault(key, i)
+    outputList = [inputList[inputIndices[d]] if d in inputIndices else padWith for d in outputKeys]
     return outputList
 
 
@@ -26,7 +26,6 @@ __all__ = ["DrpAssociationPipeTask",
            "DrpAssociationPipeConfig",
            "DrpAssociationPipeConnections"]
 
-import numpy as np
 import pandas as pd
 
 import lsst.geom as geom
@@ -237,9 +236,8 @@ class DrpAssociationPipeTask(pipeBase.PipelineTask):
             Booleans representing if the DiaSources are contained within the
             current patch and tract.
         """
-        isInPatch = np.array([
-            innerPatchBox.contains(
-                wcs.skyToPixel(
-                    geom.SpherePoint(row["ra"], row["dec"], geom.degrees)))
-            for idx, row in cat.iterrows()])
+        xs, ys = wcs.skyToPixelArray(cat["ra"].to_numpy(),
+                                     cat["dec"].to_numpy(),
+                                     degrees=True)
+        isInPatch = innerPatchBox.contains(xs, ys)
         return isInPatch
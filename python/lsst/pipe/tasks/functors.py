@@ -35,6 +35,8 @@ __all__ = ["init_fromDict", "Functor", "CompositeFunctor", "mag_aware_eval",
            "LocalDipoleDiffFluxErr", "Ebv",
            ]
 
+import copy
+import functools
 import logging
 import os
 import os.path
@@ -94,6 +96,29 @@ def init_fromDict(initDict, basePath='lsst.pipe.tasks.functors',
     return element
 
 
+@functools.lru_cache(maxsize=8)
+def _readTranslationDefinition(filename, mtime):
+    """Read a functor definition YAML file.
+
+    Parsed definitions are cached on the file name and modification time,
+    so that constructing many composite functors reads each file once.
+
+    Parameters
+    ----------
+    filename : `str`
+        Path to the YAML file, with environment variables expanded.
+    mtime : `float`
+        Modification time of the file; part of the cache key only.
+
+    Returns
+    -------
+    translationDefinition : `dict`
+        Parsed contents of the file. Callers must not modify it.
+    """
+    with open(filename) as f:
+        return yaml.safe_load(f)
+
+
 class Functor(object):
     """Define and execute a calculation on a DataFrame or Handle holding a
     DataFrame.
@@ -542,10 +567,10 @@ class CompositeFunctor(Functor):
     def from_file(cls, filename, **kwargs):
         # Allow environment variables in the filename.
         filename = os.path.expandvars(filename)
-        with open(filename) as f:
-            translationDefinition = yaml.safe_load(f)
-
-        return cls.from_yaml(translationDefinition, **kwargs)
+        translationDefinition = _readTranslationDefinition(filename, os.path.getmtime(filename))
+        # Functors are mutable, so build fresh ones from a copy of the cached
+        # definition.
+        return cls.from_yaml(copy.deepcopy(translationDefinition), **kwargs)
 
     @classmethod
     def from_yaml(cls, translationDefinition, **kwargs):
@@ -23,6 +23,7 @@ __all__ = ["MakeWarpTask", "MakeWarpConfig"]
 
 import logging
 import numpy
+from concurrent.futures import ThreadPoolExecutor
 
 import lsst.pex.config as pexConfig
 import lsst.afw.image as afwImage
@@ -165,6 +166,12 @@ class MakeWarpConfig(pipeBase.PipelineTaskConfig, CoaddBaseTask.ConfigClass,
         doc="Apply sky correction?",
     )
     idGenerator = DetectorVisitIdGeneratorConfig.make_field()
+    doPrefetchInputs = pexConfig.Field(
+        dtype=bool,
+        doc="Read the next calexp in a background thread while the current one is processed? "
+            "If False, calexps are read serially as they are needed.",
+        default=False,
+    )
 
     def validate(self):
         CoaddBaseTask.ConfigClass.validate(self)
@@ -461,12 +468,8 @@ class MakeWarpTask(CoaddBaseTask):
         includeCalibVar = self.config.includeCalibVar
 
         indices = []
-        for index, (calexp, background, skyCorr) in enumerate(zip(calExpList,
-                                                                  backgroundList,
-                                                                  skyCorrList)):
-            if isinstance(calexp, DeferredDatasetHandle):
-                calexp = calexp.get()
-
+        calExps = _iterPrefetched(calExpList, prefetch=self.config.doPrefetchInputs)
+        for index, (calexp, background, skyCorr) in enumerate(zip(calExps, backgroundList, skyCorrList)):
             if not self.config.bgSubtracted:
                 calexp.maskedImage += background.getImage()
 
@@ -574,6 +577,43 @@ class MakeWarpTask(CoaddBaseTask):
         return warpTypeList
 
 
+def _iterPrefetched(inputList, prefetch=True):
+    """Iterate over inputs, reading deferred datasets one step ahead.
+
+    While the caller processes one input, the next
+    `~lsst.daf.butler.DeferredDatasetHandle` in ``inputList`` is read in a
+    background thread, so that I/O overlaps with computation.
+
+    Parameters
+    ----------
+    inputList : `list` [`lsst.daf.butler.DeferredDatasetHandle` or `object`]
+        Inputs to iterate over.  Elements that are not deferred handles are
+        yielded unchanged.
+    prefetch : `bool`, optional
+        Read ahead in a background thread? If `False`, each input is read in
+        the calling thread when it is reached.
+
+    Yields
+    ------
+    item : `object`
+        The loaded dataset (or the input element itself), in order.
+    """
+    def load(item):
+        return item.get() if isinstance(item, DeferredDatasetHandle) else item
+
+    if not prefetch:
+        yield from map(load, inputList)
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(load, inputList[0]) if inputList else None
+        for index in range(len(inputList)):
+            item = future.result()
+            if index + 1 < len(inputList):
+                future = executor.submit(load, inputList[index + 1])
+            yield item
+
+
 def reorderRefs(inputRefs, outputSortKeyOrder, dataIdKey):
     """Reorder inputRefs per outputSortKeyOrder.
 
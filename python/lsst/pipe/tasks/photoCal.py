@@ -262,9 +262,7 @@ class PhotoCalTask(pipeBase.Task):
 
             # extract the matched refCat as a Catalog for the colorterm code
             refCat.reserve(len(matches))
-            for x in matches:
-                record = refCat.addNew()
-                record.assign(x.first)
+            refCat.extend((x.first for x in matches), deep=True)
 
             refMagArr, refMagErrArr = colorterm.getCorrectedMagnitudes(refCat)
             fluxFieldList = [getRefFluxField(refSchema, filt) for filt in (colorterm.primary,
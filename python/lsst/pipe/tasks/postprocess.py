@@ -36,11 +36,12 @@ __all__ = ["WriteObjectTableConfig", "WriteObjectTableTask",
            "ConsolidateTractConfig", "ConsolidateTractTask"]
 
 import functools
+import itertools
 import pandas as pd
 import logging
 import numpy as np
-import numbers
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import lsst.geom
 import lsst.pex.config as pexConfig
@@ -59,25 +60,194 @@ log = logging.getLogger(__name__)
 def flattenFilters(df, noDupCols=["coord_ra", "coord_dec"], camelCase=False, inputBands=None):
     """Flattens a dataframe with multilevel column index.
     """
-    newDf = pd.DataFrame()
+    columnFormat = "{0}{1}" if camelCase else "{0}_{1}"
+    parts = []
     # band is the level 0 index
     dfBands = df.columns.unique(level=0).values
     for band in dfBands:
         subdf = df[band]
-        columnFormat = "{0}{1}" if camelCase else "{0}_{1}"
-        newColumns = {c: columnFormat.format(band, c)
-                      for c in subdf.columns if c not in noDupCols}
-        cols = list(newColumns.keys())
-        newDf = pd.concat([newDf, subdf[cols].rename(columns=newColumns)], axis=1)
+        subdf = subdf[[c for c in subdf.columns if c not in noDupCols]]
+        subdf.columns = [columnFormat.format(band, c) for c in subdf.columns]
+        parts.append(subdf)
 
     # Band must be present in the input and output or else column is all NaN:
     presentBands = dfBands if inputBands is None else list(set(inputBands).intersection(dfBands))
     # Get the unexploded columns from any present band's partition
     noDupDf = df[presentBands[0]][noDupCols]
-    newDf = pd.concat([noDupDf, newDf], axis=1)
+    # Concatenate everything at once rather than growing a frame per band.
+    newDf = pd.concat([noDupDf] + parts, axis=1, copy=False)
     return newDf
 
 
+def _catalogColumns(catalog, names):
+    """Read named columns from an afw catalog as arrays.
+
+    Parameters
+    ----------
+    catalog : `lsst.afw.table.BaseCatalog`
+        Catalog to read; copied first if it is not contiguous.
+    names : `list` [`str`]
+        Names of the fields to read.
+
+    Returns
+    -------
+    columns : `dict` [`str`, `numpy.ndarray`]
+        Mapping from field name to column, in the order of ``names``.
+        Numeric columns are views into the catalog; string columns are
+        object arrays of `str`.
+    """
+    if not catalog.isContiguous():
+        catalog = catalog.copy(deep=True)
+
+    columns = {}
+    for name in names:
+        item = catalog.schema.find(name)
+        if item.field.getTypeString() == "String":
+            # Object dtype, as pandas stores strings; this also keeps the
+            # column's type when the catalog is empty.
+            columns[name] = np.array([record.get(item.key) for record in catalog], dtype=object)
+        else:
+            columns[name] = catalog[item.key]
+    return columns
+
+
+def _catalogToDataFrame(catalog, index="id", drop=True, sort=False):
+    """Convert an afw catalog to a DataFrame indexed by one of its fields.
+
+    Columns are read straight from the catalog rather than through an
+    intermediate `astropy.table.Table`; the result is the same as
+    ``catalog.asAstropy().to_pandas().set_index(index, drop=drop)``.
+    Catalogs with array fields are converted through astropy.
+
+    Parameters
+    ----------
+    catalog : `lsst.afw.table.BaseCatalog`
+        Catalog to convert.
+    index : `str`, optional
+        Name of the field to use as the index.
+    drop : `bool`, optional
+        Whether to drop the index field from the columns.
+    sort : `bool`, optional
+        Whether to order the columns by name rather than schema order.
+
+    Returns
+    -------
+    df : `pandas.DataFrame`
+        One column per schema field (angles in radians), indexed by
+        ``index``.
+
+    Notes
+    -----
+    When ``catalog`` is contiguous and has no array fields, the numeric
+    columns of the returned frame are writable views of the catalog's
+    memory, not copies. Modifying those columns in place also modifies the
+    catalog (and vice versa); adding or replacing whole columns does not.
+    Callers that need to modify values in place and keep the catalog
+    unchanged must copy the frame first.
+    """
+    items = list(catalog.schema)
+    if any(item.field.getTypeString().startswith("Array") for item in items):
+        # Multidimensional columns need astropy's handling.
+        df = catalog.asAstropy().to_pandas().set_index(index, drop=drop)
+        return df.reindex(sorted(df.columns), axis=1) if sort else df
+    names = [item.field.getName() for item in items]
+    columns = _catalogColumns(catalog, sorted(names) if sort else names)
+    ids = columns.pop(index) if drop else columns[index].copy()
+    # Numeric columns are views into the (contiguous) catalog; wrap them
+    # without copying.
+    return pd.DataFrame(columns, index=pd.Index(ids, name=index), copy=False)
+
+
+def _isStreamable(df):
+    """Return whether a table can be copied into preallocated arrays.
+
+    Parameters
+    ----------
+    df : `pandas.DataFrame`
+        Table (or empty table carrying its schema) to check.
+
+    Returns
+    -------
+    streamable : `bool`
+        `True` if the table has flat, unique columns, a flat index, and only
+        NumPy dtypes.
+    """
+    return (not isinstance(df.columns, pd.MultiIndex)
+            and not isinstance(df.index, pd.MultiIndex)
+            and df.columns.is_unique
+            and isinstance(df.index.dtype, np.dtype)
+            and all(isinstance(dtype, np.dtype) for dtype in df.dtypes))
+
+
+def _concatenateDeferred(handles, log):
+    """Concatenate DataFrames row-wise, holding one input at a time.
+
+    The row counts and schemas of all inputs are read first. If they all
+    share one flat schema with NumPy dtypes, the output columns are
+    preallocated and each table is copied into its slice as it is read, so
+    peak memory is the output plus one input rather than all inputs plus the
+    output. Otherwise the inputs are read and handed to `pandas.concat`.
+
+    Parameters
+    ----------
+    handles : `list` [`lsst.daf.butler.DeferredDatasetHandle`]
+        Handles to the DataFrames, in output order.
+    log : `logging.Logger`
+        Logger for reporting the fallback to `pandas.concat`.
+
+    Returns
+    -------
+    df : `pandas.DataFrame`
+        Row-wise concatenation of the inputs, in order.
+    """
+    schemas = [handle.get(component="schema").schema for handle in handles]
+    first = schemas[0]
+    if not (_isStreamable(first)
+            and all(schema.columns.equals(first.columns)
+                    and schema.dtypes.equals(first.dtypes)
+                    and schema.index.dtype == first.index.dtype
+                    for schema in schemas[1:])):
+        log.info("Input tables have differing or extension dtypes; using pd.concat.")
+        return pd.concat([handle.get() for handle in handles])
+
+    nRows = [handle.get(component="rowcount") for handle in handles]
+    offsets = np.concatenate([[0], np.cumsum(nRows, dtype=np.int64)])
+    columns = {name: np.empty(offsets[-1], dtype=dtype) for name, dtype in first.dtypes.items()}
+    index = np.empty(offsets[-1], dtype=first.index.dtype)
+    for handle, start, stop in zip(handles, offsets[:-1], offsets[1:]):
+        df = handle.get()
+        index[start:stop] = df.index.to_numpy()
+        for name, column in columns.items():
+            column[start:stop] = df[name].to_numpy()
+        del df
+    return pd.DataFrame(columns, index=pd.Index(index, name=first.index.name), copy=False)
+
+
+def _mapWithThreads(func, items, numThreads):
+    """Apply a function to each item, optionally in a thread pool.
+
+    Parameters
+    ----------
+    func : callable
+        Function of one argument to apply.
+    items : `list`
+        Items to apply ``func`` to.
+    numThreads : `int`
+        Maximum number of threads. With 1, ``func`` is applied serially in
+        the calling thread.
+
+    Yields
+    ------
+    result
+        Result of ``func`` for each item, in input order.
+    """
+    if numThreads <= 1 or len(items) <= 1:
+        yield from map(func, items)
+        return
+    with ThreadPoolExecutor(max_workers=min(numThreads, len(items))) as executor:
+        yield from executor.map(func, items)
+
+
 class WriteObjectTableConnections(pipeBase.PipelineTaskConnections,
                                   defaultTemplates={"coaddName": "deep"},
                                   dimensions=("tract", "patch", "skymap")):
@@ -135,15 +305,14 @@ class WriteObjectTableTask(pipeBase.PipelineTask):
     def runQuantum(self, butlerQC, inputRefs, outputRefs):
         inputs = butlerQC.get(inputRefs)
 
-        measDict = {ref.dataId["band"]: {"meas": cat} for ref, cat in
-                    zip(inputRefs.inputCatalogMeas, inputs["inputCatalogMeas"])}
-        forcedSourceDict = {ref.dataId["band"]: {"forced_src": cat} for ref, cat in
+        forcedSourceDict = {ref.dataId["band"]: cat for ref, cat in
                             zip(inputRefs.inputCatalogForcedSrc, inputs["inputCatalogForcedSrc"])}
 
         catalogs = {}
-        for band in measDict.keys():
-            catalogs[band] = {"meas": measDict[band]["meas"],
-                              "forced_src": forcedSourceDict[band]["forced_src"],
+        for ref, cat in zip(inputRefs.inputCatalogMeas, inputs["inputCatalogMeas"]):
+            band = ref.dataId["band"]
+            catalogs[band] = {"meas": cat,
+                              "forced_src": forcedSourceDict[band],
                               "ref": inputs["inputCatalogRef"]}
         dataId = butlerQC.quantum.dataId
         df = self.run(catalogs=catalogs, tract=dataId["tract"], patch=dataId["patch"])
@@ -168,19 +337,32 @@ class WriteObjectTableTask(pipeBase.PipelineTask):
             Merged dataframe.
         """
         dfs = []
-        for filt, tableDict in catalogs.items():
-            for dataset, table in tableDict.items():
-                # Convert afwTable to pandas DataFrame
-                df = table.asAstropy().to_pandas().set_index("id", drop=True)
-
-                # Sort columns by name, to ensure matching schema among patches
-                df = df.reindex(sorted(df.columns), axis=1)
-                df = df.assign(tractId=tract, patchId=patch)
-
-                # Make columns a 3-level MultiIndex
-                df.columns = pd.MultiIndex.from_tuples([(dataset, filt, c) for c in df.columns],
-                                                       names=("dataset", "band", "column"))
-                dfs.append(df)
+        # The same ref catalog is shared by every band; convert each
+        # distinct table only once and relabel shallow copies per band.
+        converted = {}
+        items = [(dataset, filt, table)
+                 for filt, tableDict in catalogs.items()
+                 for dataset, table in tableDict.items()]
+        for dataset, filt, table in items:
+            if id(table) not in converted:
+                # Convert afwTable to pandas DataFrame, sorting columns by
+                # name to ensure matching schema among patches.
+                df = _catalogToDataFrame(table, sort=True)
+                # Insert in place; assign() would copy every column.
+                df["tractId"] = tract
+                df["patchId"] = patch
+                converted[id(table)] = df
+            df = converted[id(table)].copy(deep=False)
+
+            # Make columns a 3-level MultiIndex; the first two levels
+            # are constant, so build it from codes rather than tuples.
+            nColumns = len(df.columns)
+            df.columns = pd.MultiIndex(levels=[[dataset], [filt], df.columns],
+                                       codes=[np.zeros(nColumns, dtype=np.intp),
+                                              np.zeros(nColumns, dtype=np.intp),
+                                              np.arange(nColumns, dtype=np.intp)],
+                                       names=("dataset", "band", "column"))
+            dfs.append(df)
 
         # We do this dance and not `pd.concat(dfs)` because the pandas
         # concatenation uses infinite memory.
@@ -247,7 +429,7 @@ class WriteSourceTableTask(pipeBase.PipelineTask):
                 `DataFrame` version of the input catalog
         """
         self.log.info("Generating DataFrame from src catalog visit,detector=%i,%i", visit, detector)
-        df = catalog.asAstropy().to_pandas().set_index("id", drop=True)
+        df = _catalogToDataFrame(catalog)
         df["visit"] = visit
         # int16 instead of uint8 because databases don't like unsigned bytes.
         df["detector"] = np.int16(detector)
@@ -287,6 +469,12 @@ class WriteRecalibratedSourceTableTask(WriteSourceTableTask):
     _DefaultName = "writeRecalibratedSourceTable"
     ConfigClass = WriteRecalibratedSourceTableConfig
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Schema mappers and measurement tasks built by addCalibColumns,
+        # keyed by the ordered field names of the input schema.
+        self._calibColumnCache = {}
+
     def runQuantum(self, butlerQC, inputRefs, outputRefs):
         inputs = butlerQC.get(inputRefs)
 
@@ -367,33 +555,21 @@ class WriteRecalibratedSourceTableTask(WriteSourceTableTask):
         newCat:  `lsst.afw.table.SourceCatalog`
             Source Catalog with requested local calib columns
         """
-        measureConfig = SingleFrameMeasurementTask.ConfigClass()
-        measureConfig.doReplaceWithNoise = False
+        if not (self.config.doReevaluateSkyWcs or self.config.doReevaluatePhotoCalib):
+            # No plugins to rerun; the catalog is returned unchanged.
+            return catalog
 
-        # Clear all slots, because we aren't running the relevant plugins.
-        for slot in measureConfig.slots:
-            setattr(measureConfig.slots, slot, None)
-
-        measureConfig.plugins.names = []
         if self.config.doReevaluateSkyWcs:
-            measureConfig.plugins.names.add("base_LocalWcs")
             self.log.info("Re-evaluating base_LocalWcs plugin")
         if self.config.doReevaluatePhotoCalib:
-            measureConfig.plugins.names.add("base_LocalPhotoCalib")
             self.log.info("Re-evaluating base_LocalPhotoCalib plugin")
-        pluginsNotToCopy = tuple(measureConfig.plugins.names)
-
-        # Create a new schema and catalog
-        # Copy all columns from original except for the ones to reevaluate
-        aliasMap = catalog.schema.getAliasMap()
-        mapper = afwTable.SchemaMapper(catalog.schema)
-        for item in catalog.schema:
-            if not item.field.getName().startswith(pluginsNotToCopy):
-                mapper.addMapping(item.key)
 
-        schema = mapper.getOutputSchema()
-        measurement = SingleFrameMeasurementTask(config=measureConfig, schema=schema)
-        schema.setAliasMap(aliasMap)
+        # The mapper and measurement task depend only on the input schema
+        # (the config is frozen), so build them once per distinct schema.
+        cacheKey = tuple(catalog.schema.getOrderedNames())
+        if cacheKey not in self._calibColumnCache:
+            self._calibColumnCache[cacheKey] = self._makeCalibColumnMeasurement(catalog.schema)
+        mapper, measurement, schema = self._calibColumnCache[cacheKey]
         newCat = afwTable.SourceCatalog(schema)
         newCat.extend(catalog, mapper=mapper)
 
@@ -420,6 +596,50 @@ class WriteRecalibratedSourceTableTask(WriteSourceTableTask):
 
         return newCat
 
+    def _makeCalibColumnMeasurement(self, inputSchema):
+        """Build the schema mapper and measurement task for addCalibColumns.
+
+        Parameters
+        ----------
+        inputSchema : `lsst.afw.table.Schema`
+            Schema of the catalog to which calib columns will be added.
+
+        Returns
+        -------
+        mapper : `lsst.afw.table.SchemaMapper`
+            Mapper copying all columns except the ones to reevaluate.
+        measurement : `lsst.meas.base.SingleFrameMeasurementTask`
+            Measurement task whose plugins reevaluate the calib columns.
+        schema : `lsst.afw.table.Schema`
+            Output schema, including the reevaluated calib columns.
+        """
+        measureConfig = SingleFrameMeasurementTask.ConfigClass()
+        measureConfig.doReplaceWithNoise = False
+
+        # Clear all slots, because we aren't running the relevant plugins.
+        for slot in measureConfig.slots:
+            setattr(measureConfig.slots, slot, None)
+
+        measureConfig.plugins.names = []
+        if self.config.doReevaluateSkyWcs:
+            measureConfig.plugins.names.add("base_LocalWcs")
+        if self.config.doReevaluatePhotoCalib:
+            measureConfig.plugins.names.add("base_LocalPhotoCalib")
+        pluginsNotToCopy = tuple(measureConfig.plugins.names)
+
+        # Create a new schema
+        # Copy all columns from original except for the ones to reevaluate
+        aliasMap = inputSchema.getAliasMap()
+        mapper = afwTable.SchemaMapper(inputSchema)
+        for item in inputSchema:
+            if not item.field.getName().startswith(pluginsNotToCopy):
+                mapper.addMapping(item.key)
+
+        schema = mapper.getOutputSchema()
+        measurement = SingleFrameMeasurementTask(config=measureConfig, schema=schema)
+        schema.setAliasMap(aliasMap)
+        return mapper, measurement, schema
+
 
 class PostprocessAnalysis(object):
     """Calculate columns from DataFrames or handles storing DataFrames.
@@ -498,6 +718,16 @@ class PostprocessAnalysis(object):
 
         self._df = None
 
+    @property
+    def filt(self):
+        return self._filt
+
+    @filt.setter
+    def filt(self, filt):
+        self._filt = filt
+        self._func = None
+        self._noDupCols = None
+
     @property
     def defaultFuncs(self):
         funcs = dict(self._defaultFuncs)
@@ -505,24 +735,35 @@ class PostprocessAnalysis(object):
 
     @property
     def func(self):
-        additionalFuncs = self.defaultFuncs
-        additionalFuncs.update({flag: Column(flag, dataset="forced_src") for flag in self.forcedFlags})
-        additionalFuncs.update({flag: Column(flag, dataset="ref") for flag in self.refFlags})
-        additionalFuncs.update({flag: Column(flag, dataset="meas") for flag in self.flags})
-
-        if isinstance(self.functors, CompositeFunctor):
-            func = self.functors
-        else:
-            func = CompositeFunctor(self.functors)
+        # The composite functor is built once; it is rebuilt only if filt
+        # is changed.
+        if self._func is None:
+            additionalFuncs = self.defaultFuncs
+            additionalFuncs.update({flag: Column(flag, dataset="forced_src") for flag in self.forcedFlags})
+            additionalFuncs.update({flag: Column(flag, dataset="ref") for flag in self.refFlags})
+            additionalFuncs.update({flag: Column(flag, dataset="meas") for flag in self.flags})
+
+            if isinstance(self.functors, CompositeFunctor):
+                func = self.functors
+            else:
+                func = CompositeFunctor(self.functors)
 
-        func.funcDict.update(additionalFuncs)
-        func.filt = self.filt
+            func.funcDict.update(additionalFuncs)
+            func.filt = self.filt
+            self._func = func
+        elif self._func.filt != self.filt:
+            # The functors may be shared with other analyses (e.g. one per
+            # band), so make sure they are set to this analysis' filter.
+            self._func.filt = self.filt
 
-        return func
+        return self._func
 
     @property
     def noDupCols(self):
-        return [name for name, func in self.func.funcDict.items() if func.noDup or func.dataset == "ref"]
+        if self._noDupCols is None:
+            self._noDupCols = [name for name, func in self.func.funcDict.items()
+                               if func.noDup or func.dataset == "ref"]
+        return self._noDupCols
 
     @property
     def df(self):
@@ -847,7 +1088,7 @@ class TransformObjectCatalogTask(TransformCatalogBaseTask):
         # NOTE: band kwarg is ignored here.
         dfDict = {}
         analysisDict = {}
-        templateDf = pd.DataFrame()
+        templateDf = None
 
         columns = handle.get(component="columns")
         inputBands = columns.unique(level=1).values
@@ -863,40 +1104,45 @@ class TransformObjectCatalogTask(TransformCatalogBaseTask):
             result = self.transform(inputBand, handle, funcs, dataId)
             dfDict[inputBand] = result.df
             analysisDict[inputBand] = result.analysis
-            if templateDf.empty:
+            if templateDf is None:
                 templateDf = result.df
 
+        if templateDf is None:
+            # No input band was transformed.
+            templateDf = pd.DataFrame()
+
         # Put filler values in columns of other wanted bands
         for filt in outputBands:
             if filt not in dfDict:
                 self.log.info("Adding empty columns for band %s", filt)
-                dfTemp = templateDf.copy()
-                for col in dfTemp.columns:
-                    testValue = dfTemp[col].values[0]
-                    if isinstance(testValue, (np.bool_, pd.BooleanDtype)):
+                # Classify the columns by dtype once, then allocate each
+                # filled column directly rather than copying the template
+                # and overwriting it.
+                dtypes = templateDf.dtypes
+                if dtypes.map(pd.api.types.is_unsigned_integer_dtype).any():
+                    raise ValueError("Parquet tables may not have unsigned integer columns.")
+                nRows = len(templateDf)
+                data = {}
+                for col, dtype in dtypes.items():
+                    if pd.api.types.is_bool_dtype(dtype):
                         # Boolean flag type, check if it is a "good" flag
-                        if col in self.config.goodFlags:
-                            fillValue = False
-                        else:
-                            fillValue = True
-                    elif isinstance(testValue, numbers.Integral):
-                        # Checking numbers.Integral catches all flavors
-                        # of python, numpy, pandas, etc. integers.
-                        # We must ensure this is not an unsigned integer.
-                        if isinstance(testValue, np.unsignedinteger):
-                            raise ValueError("Parquet tables may not have unsigned integer columns.")
-                        else:
-                            fillValue = self.config.integerFillValue
+                        fillValue = col not in self.config.goodFlags
+                    elif pd.api.types.is_integer_dtype(dtype):
+                        fillValue = self.config.integerFillValue
                     else:
                         fillValue = self.config.floatFillValue
-                    dfTemp[col].values[:] = fillValue
+                    if isinstance(dtype, np.dtype):
+                        data[col] = np.full(nRows, fillValue, dtype=dtype)
+                    else:
+                        data[col] = pd.array(np.full(nRows, fillValue), dtype=dtype)
+                dfTemp = pd.DataFrame(data, index=templateDf.index, columns=templateDf.columns, copy=False)
                 dfDict[filt] = dfTemp
 
         # This makes a multilevel column index, with band as first level
-        df = pd.concat(dfDict, axis=1, names=["band", "column"])
+        df = pd.concat(dfDict, axis=1, names=["band", "column"], copy=False)
 
         if not self.config.multilevelOutput:
-            noDupCols = list(set.union(*[set(v.noDupCols) for v in analysisDict.values()]))
+            noDupCols = list(set(itertools.chain.from_iterable(v.noDupCols for v in analysisDict.values())))
             if self.config.primaryKey in noDupCols:
                 noDupCols.remove(self.config.primaryKey)
             if dataId and self.config.columnsFromDataId:
@@ -1020,7 +1266,13 @@ class ConsolidateVisitSummaryConnections(pipeBase.PipelineTaskConnections,
 class ConsolidateVisitSummaryConfig(pipeBase.PipelineTaskConfig,
                                     pipelineConnections=ConsolidateVisitSummaryConnections):
     """Config for ConsolidateVisitSummaryTask"""
-    pass
+    numReadThreads = pexConfig.Field(
+        dtype=int,
+        default=1,
+        check=lambda x: x >= 1,
+        doc="Number of threads used to read the per-detector exposure components. "
+            "With 1, the components are read serially.",
+    )
 
 
 class ConsolidateVisitSummaryTask(pipeBase.PipelineTask):
@@ -1086,28 +1338,25 @@ class ConsolidateVisitSummaryTask(pipeBase.PipelineTask):
 
         cat["visit"] = visit
 
-        for i, dataRef in enumerate(dataRefs):
-            visitInfo = dataRef.get(component="visitInfo")
-            filterLabel = dataRef.get(component="filter")
-            summaryStats = dataRef.get(component="summaryStats")
-            detector = dataRef.get(component="detector")
-            wcs = dataRef.get(component="wcs")
-            photoCalib = dataRef.get(component="photoCalib")
-            detector = dataRef.get(component="detector")
-            bbox = dataRef.get(component="bbox")
-            validPolygon = dataRef.get(component="validPolygon")
+        components = _mapWithThreads(self._readExposureComponents, dataRefs, self.config.numReadThreads)
+
+        detectorIds = np.zeros(len(dataRefs), dtype=np.int64)
+        for i, component in enumerate(components):
+            filterLabel = component["filter"]
 
             rec = cat[i]
-            rec.setBBox(bbox)
-            rec.setVisitInfo(visitInfo)
-            rec.setWcs(wcs)
-            rec.setPhotoCalib(photoCalib)
-            rec.setValidPolygon(validPolygon)
+            rec.setBBox(component["bbox"])
+            rec.setVisitInfo(component["visitInfo"])
+            rec.setWcs(component["wcs"])
+            rec.setPhotoCalib(component["photoCalib"])
+            rec.setValidPolygon(component["validPolygon"])
 
             rec["physical_filter"] = filterLabel.physicalLabel if filterLabel.hasPhysicalLabel() else ""
             rec["band"] = filterLabel.bandLabel if filterLabel.hasBandLabel() else ""
-            rec.setId(detector.getId())
-            summaryStats.update_record(rec)
+            detectorIds[i] = component["detector"].getId()
+            component["summaryStats"].update_record(rec)
+
+        cat["id"] = detectorIds
 
         metadata = dafBase.PropertyList()
         metadata.add("COMMENT", "Catalog id is detector id, sorted.")
@@ -1118,6 +1367,24 @@ class ConsolidateVisitSummaryTask(pipeBase.PipelineTask):
         cat.sort()
         return cat
 
+    @staticmethod
+    def _readExposureComponents(dataRef):
+        """Read the exposure components needed for a visit summary row.
+
+        Parameters
+        ----------
+        dataRef : `lsst.daf.butler.DeferredDatasetHandle`
+            Handle to a calibrated exposure.
+
+        Returns
+        -------
+        components : `dict`
+            Mapping from component name to the component read.
+        """
+        return {component: dataRef.get(component=component)
+                for component in ("visitInfo", "filter", "summaryStats", "detector",
+                                  "wcs", "photoCalib", "bbox", "validPolygon")}
+
 
 class ConsolidateSourceTableConnections(pipeBase.PipelineTaskConnections,
                                         defaultTemplates={"catalogType": ""},
@@ -1186,6 +1453,13 @@ class MakeCcdVisitTableConnections(pipeBase.PipelineTaskConnections,
 class MakeCcdVisitTableConfig(pipeBase.PipelineTaskConfig,
                               pipelineConnections=MakeCcdVisitTableConnections):
     idGenerator = DetectorVisitIdGeneratorConfig.make_field()
+    numReadThreads = pexConfig.Field(
+        dtype=int,
+        default=1,
+        check=lambda x: x >= 1,
+        doc="Number of threads used to read the visit summaries. "
+            "With 1, the visit summaries are read serially.",
+    )
 
 
 class MakeCcdVisitTableTask(pipeBase.PipelineTask):
@@ -1211,79 +1485,105 @@ class MakeCcdVisitTableTask(pipeBase.PipelineTask):
            ``outputCatalog``
                Catalog of ccd and visit information.
         """
-        ccdEntries = []
-        for visitSummaryRef in visitSummaryRefs:
-            visitSummary = visitSummaryRef.get()
-            visitInfo = visitSummary[0].getVisitInfo()
-
-            ccdEntry = {}
-            summaryTable = visitSummary.asAstropy()
-            selectColumns = ["id", "visit", "physical_filter", "band", "ra", "dec",
-                             "pixelScale", "zenithDistance",
-                             "expTime", "zeroPoint", "psfSigma", "skyBg", "skyNoise",
-                             "astromOffsetMean", "astromOffsetStd", "nPsfStar",
-                             "psfStarDeltaE1Median", "psfStarDeltaE2Median",
-                             "psfStarDeltaE1Scatter", "psfStarDeltaE2Scatter",
-                             "psfStarDeltaSizeMedian", "psfStarDeltaSizeScatter",
-                             "psfStarScaledDeltaSizeScatter", "psfTraceRadiusDelta",
-                             "psfApFluxDelta", "psfApCorrSigmaScaledDelta",
-                             "maxDistToNearestPsf",
-                             "effTime", "effTimePsfSigmaScale",
-                             "effTimeSkyBgScale", "effTimeZeroPointScale"]
-            ccdEntry = summaryTable[selectColumns].to_pandas().set_index("id")
-            # 'visit' is the human readable visit number.
-            # 'visitId' is the key to the visitId table. They are the same.
-            # Technically you should join to get the visit from the visit
-            # table.
-            ccdEntry = ccdEntry.rename(columns={"visit": "visitId"})
-
-            # RFC-924: Temporarily keep a duplicate "decl" entry for backwards
-            # compatibility. To be removed after September 2023.
-            ccdEntry["decl"] = ccdEntry.loc[:, "dec"]
-
-            ccdEntry["ccdVisitId"] = [
+        ccdEntries = list(_mapWithThreads(self._makeCcdEntry, visitSummaryRefs, self.config.numReadThreads))
+
+        outputCatalog = pd.concat(ccdEntries, copy=False)
+        outputCatalog.set_index("ccdVisitId", inplace=True, verify_integrity=True)
+        return pipeBase.Struct(outputCatalog=outputCatalog)
+
+    def _makeCcdEntry(self, visitSummaryRef):
+        """Make the ccdVisit table rows for a single visit.
+
+        Parameters
+        ----------
+        visitSummaryRef : `lsst.daf.butler.DeferredDatasetHandle`
+            Handle pointing to an exposure catalog with per-detector summary
+            information.
+
+        Returns
+        -------
+        ccdEntry : `pandas.DataFrame`
+            One row per detector in the visit summary.
+        """
+        visitSummary = visitSummaryRef.get()
+        visitInfo = visitSummary[0].getVisitInfo()
+
+        selectColumns = ["id", "visit", "physical_filter", "band", "ra", "dec",
+                         "pixelScale", "zenithDistance",
+                         "expTime", "zeroPoint", "psfSigma", "skyBg", "skyNoise",
+                         "astromOffsetMean", "astromOffsetStd", "nPsfStar",
+                         "psfStarDeltaE1Median", "psfStarDeltaE2Median",
+                         "psfStarDeltaE1Scatter", "psfStarDeltaE2Scatter",
+                         "psfStarDeltaSizeMedian", "psfStarDeltaSizeScatter",
+                         "psfStarScaledDeltaSizeScatter", "psfTraceRadiusDelta",
+                         "psfApFluxDelta", "psfApCorrSigmaScaledDelta",
+                         "maxDistToNearestPsf",
+                         "effTime", "effTimePsfSigmaScale",
+                         "effTimeSkyBgScale", "effTimeZeroPointScale"]
+        if not visitSummary.isContiguous():
+            visitSummary = visitSummary.copy(deep=True)
+        ccdEntry = pd.DataFrame(_catalogColumns(visitSummary, selectColumns)).set_index("id")
+        detectorIds = visitSummary["id"]
+        # 'visit' is the human readable visit number.
+        # 'visitId' is the key to the visitId table. They are the same.
+        # Technically you should join to get the visit from the visit
+        # table.
+        ccdEntry = ccdEntry.rename(columns={"visit": "visitId"})
+
+        # RFC-924: Temporarily keep a duplicate "decl" entry for backwards
+        # compatibility. To be removed after September 2023.
+        ccdEntry["decl"] = ccdEntry.loc[:, "dec"]
+
+        # The ID packing is opaque, so generate the IDs one detector at
+        # a time, but straight into a typed array.
+        ccdEntry["ccdVisitId"] = np.fromiter(
+            (
                 self.config.idGenerator.apply(
                     visitSummaryRef.dataId,
                     detector=detector_id,
                     is_exposure=False,
                 ).catalog_id  # The "catalog ID" here is the ccdVisit ID
-                              # because it's usually the ID for a whole catalog
-                              # with a {visit, detector}, and that's the main
-                              # use case for IdGenerator.  This usage for a
-                              # summary table is rare.
-                for detector_id in summaryTable["id"]
-            ]
-            ccdEntry["detector"] = summaryTable["id"]
-            ccdEntry["seeing"] = (
-                visitSummary["psfSigma"] * visitSummary["pixelScale"] * np.sqrt(8 * np.log(2))
-            )
-            ccdEntry["skyRotation"] = visitInfo.getBoresightRotAngle().asDegrees()
-            ccdEntry["expMidpt"] = visitInfo.getDate().toPython()
-            ccdEntry["expMidptMJD"] = visitInfo.getDate().get(dafBase.DateTime.MJD)
-            ccdEntry["obsStart"] = (
-                ccdEntry["expMidpt"] - 0.5 * pd.Timedelta(seconds=ccdEntry["expTime"].values[0])
-            )
-            expTime_days = ccdEntry["expTime"] / (60*60*24)
-            ccdEntry["obsStartMJD"] = ccdEntry["expMidptMJD"] - 0.5 * expTime_days
-            ccdEntry["darkTime"] = visitInfo.getDarkTime()
-            ccdEntry["xSize"] = summaryTable["bbox_max_x"] - summaryTable["bbox_min_x"]
-            ccdEntry["ySize"] = summaryTable["bbox_max_y"] - summaryTable["bbox_min_y"]
-            ccdEntry["llcra"] = summaryTable["raCorners"][:, 0]
-            ccdEntry["llcdec"] = summaryTable["decCorners"][:, 0]
-            ccdEntry["ulcra"] = summaryTable["raCorners"][:, 1]
-            ccdEntry["ulcdec"] = summaryTable["decCorners"][:, 1]
-            ccdEntry["urcra"] = summaryTable["raCorners"][:, 2]
-            ccdEntry["urcdec"] = summaryTable["decCorners"][:, 2]
-            ccdEntry["lrcra"] = summaryTable["raCorners"][:, 3]
-            ccdEntry["lrcdec"] = summaryTable["decCorners"][:, 3]
-            # TODO: DM-30618, Add raftName, nExposures, ccdTemp, binX, binY,
-            # and flags, and decide if WCS, and llcx, llcy, ulcx, ulcy, etc.
-            # values are actually wanted.
-            ccdEntries.append(ccdEntry)
-
-        outputCatalog = pd.concat(ccdEntries)
-        outputCatalog.set_index("ccdVisitId", inplace=True, verify_integrity=True)
-        return pipeBase.Struct(outputCatalog=outputCatalog)
+                              # because it's usually the ID for a whole
+                              # catalog with a {visit, detector}, and
+                              # that's the main use case for IdGenerator.
+                              # This usage for a summary table is rare.
+                for detector_id in detectorIds
+            ),
+            dtype=np.int64,
+            count=len(detectorIds),
+        )
+        ccdEntry["detector"] = detectorIds
+        ccdEntry["seeing"] = (
+            visitSummary["psfSigma"] * visitSummary["pixelScale"] * np.sqrt(8 * np.log(2))
+        )
+        # Per-visit quantities are computed once as scalars and
+        # broadcast to all detector rows.
+        expDate = visitInfo.getDate()
+        expMidpt = expDate.toPython()
+        expMidptMJD = expDate.get(dafBase.DateTime.MJD)
+        ccdEntry["skyRotation"] = visitInfo.getBoresightRotAngle().asDegrees()
+        ccdEntry["expMidpt"] = expMidpt
+        ccdEntry["expMidptMJD"] = expMidptMJD
+        ccdEntry["obsStart"] = expMidpt - 0.5 * pd.Timedelta(seconds=ccdEntry["expTime"].values[0])
+        expTime_days = ccdEntry["expTime"] / (60*60*24)
+        ccdEntry["obsStartMJD"] = expMidptMJD - 0.5 * expTime_days
+        ccdEntry["darkTime"] = visitInfo.getDarkTime()
+        raCorners = visitSummary["raCorners"]
+        decCorners = visitSummary["decCorners"]
+        ccdEntry["xSize"] = visitSummary["bbox_max_x"] - visitSummary["bbox_min_x"]
+        ccdEntry["ySize"] = visitSummary["bbox_max_y"] - visitSummary["bbox_min_y"]
+        ccdEntry["llcra"] = raCorners[:, 0]
+        ccdEntry["llcdec"] = decCorners[:, 0]
+        ccdEntry["ulcra"] = raCorners[:, 1]
+        ccdEntry["ulcdec"] = decCorners[:, 1]
+        ccdEntry["urcra"] = raCorners[:, 2]
+        ccdEntry["urcdec"] = decCorners[:, 2]
+        ccdEntry["lrcra"] = raCorners[:, 3]
+        ccdEntry["lrcdec"] = decCorners[:, 3]
+        # TODO: DM-30618, Add raftName, nExposures, ccdTemp, binX, binY,
+        # and flags, and decide if WCS, and llcx, llcy, ulcx, ulcy, etc.
+        # values are actually wanted.
+        return ccdEntry
 
 
 class MakeVisitTableConnections(pipeBase.PipelineTaskConnections,
@@ -1307,7 +1607,13 @@ class MakeVisitTableConnections(pipeBase.PipelineTaskConnections,
 
 class MakeVisitTableConfig(pipeBase.PipelineTaskConfig,
                            pipelineConnections=MakeVisitTableConnections):
-    pass
+    numReadThreads = pexConfig.Field(
+        dtype=int,
+        default=1,
+        check=lambda x: x >= 1,
+        doc="Number of threads used to read the visit summaries. "
+            "With 1, the visit summaries are read serially.",
+    )
 
 
 class MakeVisitTableTask(pipeBase.PipelineTask):
@@ -1331,48 +1637,71 @@ class MakeVisitTableTask(pipeBase.PipelineTask):
             ``outputCatalog``
                  Catalog of visit information.
         """
-        visitEntries = []
-        for visitSummary in visitSummaries:
-            visitSummary = visitSummary.get()
-            visitRow = visitSummary[0]
-            visitInfo = visitRow.getVisitInfo()
-
-            visitEntry = {}
-            visitEntry["visitId"] = visitRow["visit"]
-            visitEntry["visit"] = visitRow["visit"]
-            visitEntry["physical_filter"] = visitRow["physical_filter"]
-            visitEntry["band"] = visitRow["band"]
-            raDec = visitInfo.getBoresightRaDec()
-            visitEntry["ra"] = raDec.getRa().asDegrees()
-            visitEntry["dec"] = raDec.getDec().asDegrees()
-
-            # RFC-924: Temporarily keep a duplicate "decl" entry for backwards
-            # compatibility. To be removed after September 2023.
-            visitEntry["decl"] = visitEntry["dec"]
-
-            visitEntry["skyRotation"] = visitInfo.getBoresightRotAngle().asDegrees()
-            azAlt = visitInfo.getBoresightAzAlt()
-            visitEntry["azimuth"] = azAlt.getLongitude().asDegrees()
-            visitEntry["altitude"] = azAlt.getLatitude().asDegrees()
-            visitEntry["zenithDistance"] = 90 - azAlt.getLatitude().asDegrees()
-            visitEntry["airmass"] = visitInfo.getBoresightAirmass()
-            expTime = visitInfo.getExposureTime()
-            visitEntry["expTime"] = expTime
-            visitEntry["expMidpt"] = visitInfo.getDate().toPython()
-            visitEntry["expMidptMJD"] = visitInfo.getDate().get(dafBase.DateTime.MJD)
-            visitEntry["obsStart"] = visitEntry["expMidpt"] - 0.5 * pd.Timedelta(seconds=expTime)
-            expTime_days = expTime / (60*60*24)
-            visitEntry["obsStartMJD"] = visitEntry["expMidptMJD"] - 0.5 * expTime_days
-            visitEntries.append(visitEntry)
-
-            # TODO: DM-30623, Add programId, exposureType, cameraTemp,
-            # mirror1Temp, mirror2Temp, mirror3Temp, domeTemp, externalTemp,
-            # dimmSeeing, pwvGPS, pwvMW, flags, nExposures.
-
-        outputCatalog = pd.DataFrame(data=visitEntries)
+        visitEntries = list(_mapWithThreads(self._makeVisitEntry, visitSummaries, self.config.numReadThreads))
+
+        # Transpose the rows into columns so pandas infers each column's
+        # dtype once, rather than probing a list of dicts row by row.
+        columns = {key: [visitEntry[key] for visitEntry in visitEntries]
+                   for key in (visitEntries[0] if visitEntries else ["visitId"])}
+        outputCatalog = pd.DataFrame(data=columns)
         outputCatalog.set_index("visitId", inplace=True, verify_integrity=True)
+        # The visit column duplicates the index; fill it from there rather
+        # than carrying a second copy through every row.
+        outputCatalog.insert(0, "visit", outputCatalog.index.to_numpy())
         return pipeBase.Struct(outputCatalog=outputCatalog)
 
+    def _makeVisitEntry(self, visitSummaryRef):
+        """Make the visit table row for a single visit.
+
+        Parameters
+        ----------
+        visitSummaryRef : `lsst.daf.butler.DeferredDatasetHandle`
+            Handle pointing to an exposure catalog with per-detector summary
+            information.
+
+        Returns
+        -------
+        visitEntry : `dict`
+            Visit table row, keyed by column name.
+        """
+        visitSummary = visitSummaryRef.get()
+        visitRow = visitSummary[0]
+        visitInfo = visitRow.getVisitInfo()
+
+        visitEntry = {}
+        visitEntry["visitId"] = visitRow["visit"]
+        visitEntry["physical_filter"] = visitRow["physical_filter"]
+        visitEntry["band"] = visitRow["band"]
+        raDec = visitInfo.getBoresightRaDec()
+        visitEntry["ra"] = raDec.getRa().asDegrees()
+        visitEntry["dec"] = raDec.getDec().asDegrees()
+
+        # RFC-924: Temporarily keep a duplicate "decl" entry for backwards
+        # compatibility. To be removed after September 2023.
+        visitEntry["decl"] = visitEntry["dec"]
+
+        visitEntry["skyRotation"] = visitInfo.getBoresightRotAngle().asDegrees()
+        azAlt = visitInfo.getBoresightAzAlt()
+        visitEntry["azimuth"] = azAlt.getLongitude().asDegrees()
+        altitude = azAlt.getLatitude().asDegrees()
+        visitEntry["altitude"] = altitude
+        visitEntry["zenithDistance"] = 90 - altitude
+        visitEntry["airmass"] = visitInfo.getBoresightAirmass()
+        expTime = visitInfo.getExposureTime()
+        visitEntry["expTime"] = expTime
+        expDate = visitInfo.getDate()
+        visitEntry["expMidpt"] = expDate.toPython()
+        visitEntry["expMidptMJD"] = expDate.get(dafBase.DateTime.MJD)
+        visitEntry["obsStart"] = visitEntry["expMidpt"] - 0.5 * pd.Timedelta(seconds=expTime)
+        expTime_days = expTime / (60*60*24)
+        visitEntry["obsStartMJD"] = visitEntry["expMidptMJD"] - 0.5 * expTime_days
+
+        # TODO: DM-30623, Add programId, exposureType, cameraTemp,
+        # mirror1Temp, mirror2Temp, mirror3Temp, domeTemp, externalTemp,
+        # dimmSeeing, pwvGPS, pwvMW, flags, nExposures.
+
+        return visitEntry
+
 
 class WriteForcedSourceTableConnections(pipeBase.PipelineTaskConnections,
                                         dimensions=("instrument", "visit", "detector", "skymap", "tract")):
@@ -1433,14 +1762,13 @@ class WriteForcedSourceTableTask(pipeBase.PipelineTask):
     def run(self, inputCatalog, inputCatalogDiff, visit, detector, band=None):
         dfs = []
         for table, dataset, in zip((inputCatalog, inputCatalogDiff), ("calexp", "diff")):
-            df = table.asAstropy().to_pandas().set_index(self.config.key, drop=False)
-            df = df.reindex(sorted(df.columns), axis=1)
+            df = _catalogToDataFrame(table, index=self.config.key, drop=False, sort=True)
             df["visit"] = visit
             # int16 instead of uint8 because databases don't like unsigned bytes.
             df["detector"] = np.int16(detector)
             df["band"] = band if band else pd.NA
-            df.columns = pd.MultiIndex.from_tuples([(dataset, c) for c in df.columns],
-                                                   names=("dataset", "column"))
+            df.columns = pd.MultiIndex.from_product([[dataset], df.columns],
+                                                    names=("dataset", "column"))
 
             dfs.append(df)
 
@@ -1568,6 +1896,7 @@ class ConsolidateTractConnections(pipeBase.PipelineTaskConnections,
         storageClass="DataFrame",
         dimensions=("tract", "patch", "skymap"),
         multiple=True,
+        deferLoad=True,
     )
 
     outputCatalog = connectionTypes.Output(
@@ -1597,5 +1926,5 @@ class ConsolidateTractTask(pipeBase.PipelineTask):
         self.log.info("Concatenating %s per-patch %s Tables",
                       len(inputs["inputCatalogs"]),
                       inputRefs.inputCatalogs[0].datasetType.name)
-        df = pd.concat(inputs["inputCatalogs"])
+        df = _concatenateDeferred(inputs["inputCatalogs"], self.log)
         butlerQC.put(pipeBase.Struct(outputCatalog=df), outputRefs)
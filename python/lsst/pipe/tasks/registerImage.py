@@ -135,15 +135,26 @@ class RegisterTask(Task):
         copyMatches = type(matches)(matches)
         refCoordKey = copyMatches[0].first.getTable().getCoordKey()
         inCentroidKey = copyMatches[0].second.getTable().getCentroidSlot().getMeasKey()
+        # Extract match positions once, so that each iteration can compute
+        # all separations with array operations.
+        refCoords = [m.first.get(refCoordKey) for m in matches]
+        refRa = numpy.array([coord.getRa().asRadians() for coord in refCoords])
+        refDec = numpy.array([coord.getDec().asRadians() for coord in refCoords])
+        inCentroids = [m.second.get(inCentroidKey) for m in matches]
+        inX = numpy.array([point.getX() for point in inCentroids])
+        inY = numpy.array([point.getY() for point in inCentroids])
+        indices = numpy.arange(len(matches))
         for i in range(self.config.sipIter):
             sipFit = makeCreateWcsWithSip(copyMatches, inputWcs, self.config.sipOrder, inputBBox)
             self.log.debug("Registration WCS RMS iteration %d: %f pixels",
                            i, sipFit.getScatterInPixels())
             wcs = sipFit.getNewWcs()
-            dr = [m.first.get(refCoordKey).separation(
-                wcs.pixelToSky(m.second.get(inCentroidKey))).asArcseconds() for
-                m in copyMatches]
-            dr = numpy.array(dr)
+            ra, dec = wcs.pixelToSkyArray(inX[indices], inY[indices])
+            # Haversine formula for the great-circle separation.
+            sinHalfDRa = numpy.sin(0.5*(ra - refRa[indices]))
+            sinHalfDDec = numpy.sin(0.5*(dec - refDec[indices]))
+            hav = sinHalfDDec**2 + numpy.cos(dec)*numpy.cos(refDec[indices])*sinHalfDRa**2
+            dr = numpy.degrees(2.0*numpy.arcsin(numpy.sqrt(numpy.clip(hav, 0.0, 1.0))))*3600.0
             rms = math.sqrt((dr*dr).mean())  # RMS from zero
             rms = max(rms, 1.0e-9)  # Don't believe any RMS smaller than this
             self.log.debug("Registration iteration %d: rms=%f", i, rms)
@@ -153,6 +164,7 @@ class RegisterTask(Task):
             if numBad == 0:
                 break
             copyMatches = type(matches)(copyMatches[i] for i in good)
+            indices = indices[good]
 
         sipFit = makeCreateWcsWithSip(copyMatches, inputWcs, self.config.sipOrder, inputBBox)
         self.log.info("Registration WCS: final WCS RMS=%f pixels from %d matches",
@@ -215,24 +227,20 @@ class RegisterTask(Task):
             Warped sources.
         """
         alignedSources = inputSources.copy(True)
-        if not isinstance(templateBBox, geom.Box2D):
-            # There is no method Box2I::contains(Point2D)
-            templateBBox = geom.Box2D(templateBBox)
         table = alignedSources.getTable()
         coordKey = table.getCoordKey()
         centroidKey = table.getCentroidSlot().getMeasKey()
-        deleteList = []
-        for i, s in enumerate(alignedSources):
-            oldCentroid = s.get(centroidKey)
-            newCoord = newWcs.pixelToSky(oldCentroid)
-            newCentroid = templateWcs.skyToPixel(newCoord)
-            if not templateBBox.contains(newCentroid):
-                deleteList.append(i)
-                continue
-            s.set(coordKey, newCoord)
-            s.set(centroidKey, newCentroid)
-
-        for i in reversed(deleteList):  # Delete from back so we don't change indices
-            del alignedSources[i]
-
-        return alignedSources
+        xKey, yKey = centroidKey.getX(), centroidKey.getY()
+        raKey, decKey = coordKey.getRa(), coordKey.getDec()
+
+        # Transform whole columns at once; the deep copy above guarantees
+        # the catalog is contiguous.
+        ras, decs = newWcs.pixelToSkyArray(alignedSources[xKey], alignedSources[yKey])
+        xs, ys = templateWcs.skyToPixelArray(ras, decs)
+        alignedSources[raKey] = ras
+        alignedSources[decKey] = decs
+        alignedSources[xKey] = xs
+        alignedSources[yKey] = ys
+
+        isContained = geom.Box2D(templateBBox).contains(xs, ys)
+        return alignedSources[isContained]
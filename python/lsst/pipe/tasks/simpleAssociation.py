@@ -33,7 +33,44 @@ import lsst.pex.config as pexConfig
 import lsst.pipe.base as pipeBase
 from lsst.meas.base import IdGenerator
 
-from .associationUtils import query_disc, eq2xyz, toIndex
+from .associationUtils import query_disc, eq2xyz, eq2xyzVec, toIndex
+
+
+class _IndexBuffer:
+    """Growable int64 array supporting the list operations used to track
+    DiaObject HealPix indices.
+
+    ``numpy.asarray`` on the buffer returns a view of the filled part, so
+    membership tests do not copy the indices into a new array every time.
+
+    Parameters
+    ----------
+    capacity : `int`, optional
+        Initial number of slots allocated.
+    """
+
+    def __init__(self, capacity=1024):
+        self._data = np.empty(capacity, dtype=np.int64)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        return self._data[:self._size][index]
+
+    def __setitem__(self, index, value):
+        self._data[:self._size][index] = value
+
+    def __array__(self, dtype=None, copy=None):
+        view = self._data[:self._size]
+        return view if dtype is None else view.astype(dtype, copy=False)
+
+    def append(self, value):
+        if self._size == len(self._data):
+            self._data = np.resize(self._data, max(1, 2*len(self._data)))
+        self._data[self._size] = value
+        self._size += 1
 
 
 class SimpleAssociationConfig(pexConfig.Config):
@@ -103,19 +140,25 @@ class SimpleAssociationTask(pipeBase.Task):
         # Empty lists to store matching and location data.
         diaObjectCat = []
         diaObjectCoords = []
-        healPixIndices = []
+        healPixIndices = _IndexBuffer()
 
         # Create Id factory and catalog for creating DiaObjectIds.
         if idGenerator is None:
             idGenerator = IdGenerator()
         idCat = idGenerator.make_source_catalog(afwTable.SourceTable.makeMinimalSchema())
-
-        for visit, detector in diaSources.index.levels[0]:
+        # Matching tolerance in radians, compared against chord distances.
+        tolerance = np.deg2rad(self.config.tolerance/3600)
+
+        # Split the source positions by visit,detector in a single pass
+        # rather than looking up each group in the MultiIndex. Only the
+        # positions are read from the groups, so the diaObjectId updates made
+        # to diaSources below do not need to be reflected in them.
+        for (visit, detector), orderedSources in diaSources[["ra", "dec"]].groupby(level=0):
+            orderedSources = orderedSources.droplevel(0)
             # For the first visit,detector, just copy the DiaSource info into the
             # diaObject data to create the first set of Objects.
-            orderedSources = diaSources.loc[(visit, detector)]
             if len(diaObjectCat) == 0:
-                for diaSourceId, diaSrc in orderedSources.iterrows():
+                for diaSourceId, diaSrc, hpIndex in self._iterSources(orderedSources):
                     self.addNewDiaObject(diaSrc,
                                          diaSources,
                                          visit,
@@ -124,12 +167,13 @@ class SimpleAssociationTask(pipeBase.Task):
                                          diaObjectCat,
                                          idCat,
                                          diaObjectCoords,
-                                         healPixIndices)
+                                         healPixIndices,
+                                         hpIndex=hpIndex)
                 continue
-            # Temp list to store DiaObjects already used for this visit, detector.
-            usedMatchIndicies = []
+            # Temp set of DiaObjects already used for this visit, detector.
+            usedMatchIndicies = set()
             # Run over subsequent data.
-            for diaSourceId, diaSrc in orderedSources.iterrows():
+            for diaSourceId, diaSrc, hpIndex in self._iterSources(orderedSources):
                 # Find matches.
                 matchResult = self.findMatches(diaSrc["ra"],
                                                diaSrc["dec"],
@@ -148,14 +192,15 @@ class SimpleAssociationTask(pipeBase.Task):
                                          diaObjectCat,
                                          idCat,
                                          diaObjectCoords,
-                                         healPixIndices)
+                                         healPixIndices,
+                                         hpIndex=hpIndex)
                     continue
                 # If matched, update catalogs and arrays.
-                if np.min(dists) < np.deg2rad(self.config.tolerance/3600):
-                    matchDistArg = np.argmin(dists)
+                matchDistArg = np.argmin(dists)
+                if dists[matchDistArg] < tolerance:
                     matchIndex = matches[matchDistArg]
                     # Test to see if the DiaObject has been used.
-                    if np.isin([matchIndex], usedMatchIndicies).sum() < 1:
+                    if matchIndex not in usedMatchIndicies:
                         self.updateCatalogs(matchIndex,
                                             diaSrc,
                                             diaSources,
@@ -165,7 +210,7 @@ class SimpleAssociationTask(pipeBase.Task):
                                             diaObjectCat,
                                             diaObjectCoords,
                                             healPixIndices)
-                        usedMatchIndicies.append(matchIndex)
+                        usedMatchIndicies.add(matchIndex)
                     # If the matched DiaObject has already been used, create a
                     # new DiaObject for this DiaSource.
                     else:
@@ -177,7 +222,8 @@ class SimpleAssociationTask(pipeBase.Task):
                                              diaObjectCat,
                                              idCat,
                                              diaObjectCoords,
-                                             healPixIndices)
+                                             healPixIndices,
+                                             hpIndex=hpIndex)
                 # Create new DiaObject if no match found within the matching
                 # tolerance.
                 else:
@@ -189,7 +235,8 @@ class SimpleAssociationTask(pipeBase.Task):
                                          diaObjectCat,
                                          idCat,
                                          diaObjectCoords,
-                                         healPixIndices)
+                                         healPixIndices,
+                                         hpIndex=hpIndex)
 
         # Drop indices before returning associated diaSource catalog.
         diaSources.reset_index(inplace=True)
@@ -209,6 +256,34 @@ class SimpleAssociationTask(pipeBase.Task):
             assocDiaSources=diaSources,
             diaObjects=diaObjects)
 
+    def _iterSources(self, orderedSources):
+        """Iterate over the positions of a set of DiaSources.
+
+        Reads the position columns once as arrays rather than building a
+        `pandas.Series` for every row, and computes the HealPix indices of
+        all the sources in a single call.
+
+        Parameters
+        ----------
+        orderedSources : `pandas.DataFrame`
+            DiaSources from a single visit, detector indexed on
+            diaSourceId.
+
+        Yields
+        ------
+        diaSourceId : `int`
+            Unique identifier of the DiaSource.
+        diaSrc : `dict`
+            DiaSource position with ``ra`` and ``dec`` entries.
+        hpIndex : `int`
+            HealPix index of the DiaSource position.
+        """
+        ras = orderedSources["ra"].to_numpy()
+        decs = orderedSources["dec"].to_numpy()
+        hpIndices = toIndex(self.config.nside, ras, decs)
+        for diaSourceId, ra, dec, hpIndex in zip(orderedSources.index, ras, decs, hpIndices):
+            yield diaSourceId, {"ra": ra, "dec": dec}, hpIndex
+
     def addNewDiaObject(self,
                         diaSrc,
                         diaSources,
@@ -218,13 +293,15 @@ class SimpleAssociationTask(pipeBase.Task):
                         diaObjCat,
                         idCat,
                         diaObjCoords,
-                        healPixIndices):
+                        healPixIndices,
+                        hpIndex=None):
         """Create a new DiaObject and append its data.
 
         Parameters
         ----------
-        diaSrc : `pandas.Series`
-            Full unassociated DiaSource to create a DiaObject from.
+        diaSrc : `pandas.Series` or `dict`
+            Full unassociated DiaSource to create a DiaObject from. Only
+            the ``ra`` and ``dec`` entries are used.
         diaSources : `pandas.DataFrame`
             DiaSource catalog to update information in. The catalog is
             modified in place. Must be indexed on:
@@ -244,10 +321,13 @@ class SimpleAssociationTask(pipeBase.Task):
         healPixIndices : `list` of `int`s
             HealPix indices representing the locations of each currently
             existing DiaObject.
+        hpIndex : `int`, optional
+            HealPix index of ``diaSrc``, if already computed.
         """
-        hpIndex = toIndex(self.config.nside,
-                          diaSrc["ra"],
-                          diaSrc["dec"])
+        if hpIndex is None:
+            hpIndex = toIndex(self.config.nside,
+                              diaSrc["ra"],
+                              diaSrc["dec"])
         healPixIndices.append(hpIndex)
 
         sphPoint = geom.SpherePoint(diaSrc["ra"],
@@ -278,8 +358,9 @@ class SimpleAssociationTask(pipeBase.Task):
         matchIndex : `int`
             Array index location of the DiaObject that ``diaSrc`` was
             associated to.
-        diaSrc : `pandas.Series`
-            Full unassociated DiaSource to create a DiaObject from.
+        diaSrc : `pandas.Series` or `dict`
+            Full unassociated DiaSource to create a DiaObject from. Only
+            the ``ra`` and ``dec`` entries are used.
         diaSources : `pandas.DataFrame`
             DiaSource catalog to update information in. The catalog is
             modified in place. Must be indexed on:
@@ -326,7 +407,7 @@ class SimpleAssociationTask(pipeBase.Task):
         tol : `float`
             Size of annulus to convert to covering healPixels and search for
             DiaObjects.
-        hpIndices : `list` of `int`s
+        hpIndices : `list` of `int`s or array_like
             List of heal pix indices containing the DiaObjects in ``diaObjs``.
         diaObjs : `list` of `dict`s
             Catalog diaObjects to with full location information for comparing
@@ -348,16 +429,17 @@ class SimpleAssociationTask(pipeBase.Task):
                                    src_ra,
                                    src_dec,
                                    np.deg2rad(tol/3600.))
-        matchIndices = np.argwhere(np.isin(hpIndices, match_indices)).flatten()
+        matchIndices = np.flatnonzero(np.isin(np.asarray(hpIndices), match_indices))
 
         if len(matchIndices) < 1:
             return pipeBase.Struct(dists=None, matches=None)
 
-        dists = np.array(
-            [np.sqrt(np.sum((eq2xyz(src_ra, src_dec)
-                             - eq2xyz(diaObjs[match]["ra"],
-                                      diaObjs[match]["dec"]))**2))
-             for match in matchIndices])
+        # Compute all chord distances in one pass; eq2xyzVec returns the
+        # unit vectors as the columns of a (3, N) array for N matches.
+        matchRas = [diaObjs[match]["ra"] for match in matchIndices]
+        matchDecs = [diaObjs[match]["dec"] for match in matchIndices]
+        srcXyz = eq2xyz(src_ra, src_dec)
+        dists = np.linalg.norm(eq2xyzVec(matchRas, matchDecs) - srcXyz[:, np.newaxis], axis=0)
         return pipeBase.Struct(
             dists=dists,
             matches=matchIndices)
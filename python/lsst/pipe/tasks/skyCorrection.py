@@ -89,12 +89,15 @@ def _reorderAndPadList(inputList, inputKeys, outputKeys, padWith=None):
         Copy of inputList reordered per outputKeys and padded with `padWith`
         so that the length matches length of outputKeys.
     """
-    outputList = []
-    for outputKey in outputKeys:
-        if outputKey in inputKeys:
-            outputList.append(inputList[inputKeys.index(outputKey)])
-        else:
-            outputList.append(padWith)
+    # Map each key to the position of its first occurrence, matching the
+    # semantics of list.index.
+    inputIndices = {}
+    for i, inputKey in enumerate(inputKeys):
+        inputIndices.setdefault(inputKey, i)
+    outputList = [
+        inputList[inputIndices[outputKey]] if outputKey in inputIndices else padWith
+        for outputKey in outputKeys
+    ]
     return outputList
 
 
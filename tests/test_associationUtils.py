@@ -23,7 +23,7 @@ import hpgeom as hpg
 import numpy as np
 import unittest
 
-from lsst.pipe.tasks.associationUtils import query_disc
+from lsst.pipe.tasks.associationUtils import query_disc, eq2xyz, eq2xyzVec
 import lsst.utils.tests
 
 
@@ -55,6 +55,18 @@ class TestAssociationUtils(lsst.utils.tests.TestCase):
         self.assertEqual(len(pixelReturn), 16)
         self.assertFalse(centerPixNumber in pixelReturn)
 
+    def test_eq2xyzVec(self):
+        """Test that the vectorized conversion accepts lists and returns the
+        unit vectors as columns.
+        """
+        ras = [0.0, 90.0, 225.0]
+        decs = [0.0, 45.0, -30.0]
+        vec = eq2xyzVec(ras, decs)
+        self.assertEqual(vec.shape, (3, 3))
+        for i, (ra, dec) in enumerate(zip(ras, decs)):
+            self.assertFloatsAlmostEqual(vec[:, i], eq2xyz(ra, dec), atol=1e-15)
+        self.assertEqual(eq2xyzVec(10.0, 20.0).shape, (3, 1))
+
 
 class MemoryTestCase(lsst.utils.tests.MemoryTestCase):
     pass
@@ -46,30 +46,33 @@ import lsst.utils.tests
 
 class CalibrateImageTaskTests(lsst.utils.tests.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        # The simulated truth data is never modified by the tests, so realize
+        # it once for all of them.
         # Different x/y dimensions so they're easy to distinguish in a plot,
         # and non-zero minimum, to help catch xy0 errors.
         bbox = lsst.geom.Box2I(lsst.geom.Point2I(5, 4), lsst.geom.Point2I(205, 184))
-        self.sky_center = lsst.geom.SpherePoint(245.0, -45.0, lsst.geom.degrees)
-        self.photo_calib = 12.3
-        dataset = lsst.meas.base.tests.TestDataset(bbox, crval=self.sky_center, calibration=self.photo_calib)
+        cls.sky_center = lsst.geom.SpherePoint(245.0, -45.0, lsst.geom.degrees)
+        cls.photo_calib = 12.3
+        dataset = lsst.meas.base.tests.TestDataset(bbox, crval=cls.sky_center, calibration=cls.photo_calib)
         # sqrt of area of a normalized 2d gaussian
         psf_scale = np.sqrt(4*np.pi*(dataset.psfShape.getDeterminantRadius())**2)
         noise = 10.0  # stddev of noise per pixel
         # Sources ordered from faintest to brightest.
-        self.fluxes = np.array((6*noise*psf_scale,
-                                12*noise*psf_scale,
-                                45*noise*psf_scale,
-                                150*noise*psf_scale,
-                                400*noise*psf_scale,
-                                1000*noise*psf_scale))
-        self.centroids = np.array(((162, 22),
-                                   (40, 70),
-                                   (100, 160),
-                                   (50, 120),
-                                   (92, 35),
-                                   (175, 154)), dtype=np.float32)
-        for flux, centroid in zip(self.fluxes, self.centroids):
+        cls.fluxes = np.array((6*noise*psf_scale,
+                               12*noise*psf_scale,
+                               45*noise*psf_scale,
+                               150*noise*psf_scale,
+                               400*noise*psf_scale,
+                               1000*noise*psf_scale))
+        cls.centroids = np.array(((162, 22),
+                                  (40, 70),
+                                  (100, 160),
+                                  (50, 120),
+                                  (92, 35),
+                                  (175, 154)), dtype=np.float32)
+        for flux, centroid in zip(cls.fluxes, cls.centroids):
             dataset.addSource(instFlux=flux, centroid=lsst.geom.Point2D(centroid[0], centroid[1]))
 
         # Bright extended source in the center of the image: should not appear
@@ -79,21 +82,35 @@ class CalibrateImageTaskTests(lsst.utils.tests.TestCase):
         dataset.addSource(instFlux=500*noise*psf_scale, centroid=center, shape=shape)
 
         schema = dataset.makeMinimalSchema()
-        self.truth_exposure, self.truth_cat = dataset.realize(noise=noise, schema=schema)
+        cls.truth_exposure, cls.truth_cat = dataset.realize(noise=noise, schema=schema)
         # Add in a significant background, so we can test that the output
         # background is self-consistent with the calibrated exposure.
-        self.truth_exposure.image += 500
+        cls.truth_exposure.image += 500
         # To make it look like a version=1 (nJy fluxes) refcat
-        self.truth_cat = self.truth_exposure.photoCalib.calibrateCatalog(self.truth_cat)
-        self.ref_loader = testUtils.MockReferenceObjectLoaderFromMemory([self.truth_cat])
+        cls.truth_cat = cls.truth_exposure.photoCalib.calibrateCatalog(cls.truth_cat)
+        cls.ref_loader = testUtils.MockReferenceObjectLoaderFromMemory([cls.truth_cat])
         metadata = lsst.daf.base.PropertyList()
         metadata.set("REFCAT_FORMAT_VERSION", 1)
-        self.truth_cat.setMetadata(metadata)
+        cls.truth_cat.setMetadata(metadata)
+        cls.truth_coords = SkyCoord(cls.truth_cat['coord_ra'], cls.truth_cat['coord_dec'], unit="radian")
+
+        # Result of _compute_psf(), and the config it was computed with,
+        # shared by the tests that start from it.
+        cls._psf_result = None
 
         # TODO: a cosmic ray (need to figure out how to insert a fake-CR)
-        # self.truth_exposure.image.array[10, 10] = 100000
-        # self.truth_exposure.variance.array[10, 10] = 100000/noise
+        # cls.truth_exposure.image.array[10, 10] = 100000
+        # cls.truth_exposure.variance.array[10, 10] = 100000/noise
 
+    @classmethod
+    def tearDownClass(cls):
+        del cls.truth_exposure
+        del cls.truth_cat
+        del cls.truth_coords
+        del cls.ref_loader
+        del cls._psf_result
+
+    def setUp(self):
         # Copy the truth exposure, because CalibrateImage modifies the input.
         # Post-ISR ccds only contain: initial WCS, VisitInfo, filter
         self.exposure = afwImage.ExposureF(self.truth_exposure, deep=True)
@@ -141,6 +158,44 @@ class CalibrateImageTaskTests(lsst.utils.tests.TestCase):
         # Something about this test dataset prefers a larger threshold here.
         self.config.star_selector["science"].unresolved.maximum = 0.2
 
+    def _make_task(self):
+        """Return a CalibrateImageTask using the test config, with the truth
+        catalog as both the astrometry and photometry reference catalog.
+        """
+        calibrate = CalibrateImageTask(config=self.config)
+        calibrate.astrometry.setRefObjLoader(self.ref_loader)
+        calibrate.photometry.match.setRefObjLoader(self.ref_loader)
+        return calibrate
+
+    def _compute_psf(self):
+        """Return a copy of the result of CalibrateImageTask._compute_psf()
+        on the test exposure, computing it the first time it is needed with
+        the current test config.
+
+        The exposure with the fitted PSF replaces ``self.exposure``, and the
+        catalog is a deep copy, so tests may modify both freely. The
+        background list is a new list, so tests may append to it, but the
+        background models in it are shared, as are the PSF candidates; tests
+        must not modify those.
+
+        Returns
+        -------
+        psf_stars, background, candidates
+            As returned by ``_compute_psf``.
+        """
+        cls = type(self)
+        config = self.config.toDict()
+        if cls._psf_result is None or cls._psf_result[0] != config:
+            calibrate = CalibrateImageTask(config=self.config)
+            psf_stars, background, candidates = calibrate._compute_psf(self.exposure, self.id_generator)
+            cls._psf_result = (config, afwImage.ExposureF(self.exposure, deep=True),
+                               psf_stars, background, candidates)
+        _, exposure, psf_stars, background, candidates = cls._psf_result
+        self.exposure = afwImage.ExposureF(exposure, deep=True)
+        return (psf_stars.copy(deep=True),
+                afwMath.BackgroundList(*background),
+                candidates)
+
     def _check_run(self, calibrate, result):
         """Test the result of CalibrateImage.run().
 
@@ -191,9 +246,7 @@ class CalibrateImageTaskTests(lsst.utils.tests.TestCase):
     def test_run(self):
         """Test that run() returns reasonable values to be butler put.
         """
-        calibrate = CalibrateImageTask(config=self.config)
-        calibrate.astrometry.setRefObjLoader(self.ref_loader)
-        calibrate.photometry.match.setRefObjLoader(self.ref_loader)
+        calibrate = self._make_task()
         result = calibrate.run(exposures=self.exposure)
 
         self._check_run(calibrate, result)
@@ -202,9 +255,7 @@ class CalibrateImageTaskTests(lsst.utils.tests.TestCase):
         """Test that run() returns reasonable values to be butler put, when
         passed two exposures to combine as snaps.
         """
-        calibrate = CalibrateImageTask(config=self.config)
-        calibrate.astrometry.setRefObjLoader(self.ref_loader)
-        calibrate.photometry.match.setRefObjLoader(self.ref_loader)
+        calibrate = self._make_task()
         # Halve the flux in each exposure to get the expected visit sum.
         self.exposure.image /= 2
         self.exposure.variance /= 2
@@ -217,9 +268,7 @@ class CalibrateImageTaskTests(lsst.utils.tests.TestCase):
         struct, as appropriate.
         """
         self.config.optional_outputs = None
-        calibrate = CalibrateImageTask(config=self.config)
-        calibrate.astrometry.setRefObjLoader(self.ref_loader)
-        calibrate.photometry.match.setRefObjLoader(self.ref_loader)
+        calibrate = self._make_task()
         result = calibrate.run(exposures=self.exposure)
 
         self._check_run(calibrate, result)
@@ -282,7 +331,7 @@ class CalibrateImageTaskTests(lsst.utils.tests.TestCase):
         exposure.
         """
         calibrate = CalibrateImageTask(config=self.config)
-        psf_stars, background, candidates = calibrate._compute_psf(self.exposure, self.id_generator)
+        psf_stars, background, candidates = self._compute_psf()
 
         # First check that the exposure doesn't have an ApCorrMap.
         self.assertIsNone(self.exposure.apCorrMap)
@@ -297,7 +346,7 @@ class CalibrateImageTaskTests(lsst.utils.tests.TestCase):
         in the image and returns them in the output catalog.
         """
         calibrate = CalibrateImageTask(config=self.config)
-        psf_stars, background, candidates = calibrate._compute_psf(self.exposure, self.id_generator)
+        psf_stars, background, candidates = self._compute_psf()
         calibrate._measure_aperture_correction(self.exposure, psf_stars)
 
         stars = calibrate._find_stars(self.exposure, background, self.id_generator)
@@ -325,7 +374,7 @@ class CalibrateImageTaskTests(lsst.utils.tests.TestCase):
         """
         calibrate = CalibrateImageTask(config=self.config)
         calibrate.astrometry.setRefObjLoader(self.ref_loader)
-        psf_stars, background, candidates = calibrate._compute_psf(self.exposure, self.id_generator)
+        psf_stars, background, candidates = self._compute_psf()
         calibrate._measure_aperture_correction(self.exposure, psf_stars)
         stars = calibrate._find_stars(self.exposure, background, self.id_generator)
 
@@ -334,7 +383,7 @@ class CalibrateImageTaskTests(lsst.utils.tests.TestCase):
         # Check that we got reliable matches with the truth coordinates.
         sky = stars["sky_source"]
         fitted = SkyCoord(stars[~sky]['coord_ra'], stars[~sky]['coord_dec'], unit="radian")
-        truth = SkyCoord(self.truth_cat['coord_ra'], self.truth_cat['coord_dec'], unit="radian")
+        truth = self.truth_coords
         idx, d2d, _ = fitted.match_to_catalog_sky(truth)
         np.testing.assert_array_less(d2d.to_value(u.milliarcsecond), 35.0)
 
@@ -342,10 +391,8 @@ class CalibrateImageTaskTests(lsst.utils.tests.TestCase):
         """Test that the fitted photoCalib matches the one we generated,
         and that the exposure is calibrated.
         """
-        calibrate = CalibrateImageTask(config=self.config)
-        calibrate.astrometry.setRefObjLoader(self.ref_loader)
-        calibrate.photometry.match.setRefObjLoader(self.ref_loader)
-        psf_stars, background, candidates = calibrate._compute_psf(self.exposure, self.id_generator)
+        calibrate = self._make_task()
+        psf_stars, background, candidates = self._compute_psf()
         calibrate._measure_aperture_correction(self.exposure, psf_stars)
         stars = calibrate._find_stars(self.exposure, background, self.id_generator)
         calibrate._fit_astrometry(self.exposure, stars)
@@ -368,7 +415,7 @@ class CalibrateImageTaskTests(lsst.utils.tests.TestCase):
         # sky sources.
         sky = stars["sky_source"]
         fitted = SkyCoord(stars[~sky]['coord_ra'], stars[~sky]['coord_dec'], unit="radian")
-        truth = SkyCoord(self.truth_cat['coord_ra'], self.truth_cat['coord_dec'], unit="radian")
+        truth = self.truth_coords
         idx, _, _ = fitted.match_to_catalog_sky(truth)
         # Because the input variance image does not include contributions from
         # the sources, we can't use fluxErr as a bound on the measurement
@@ -385,7 +432,7 @@ class CalibrateImageTaskTests(lsst.utils.tests.TestCase):
         and candidates.
         """
         calibrate = CalibrateImageTask(config=self.config)
-        psf_stars, background, candidates = calibrate._compute_psf(self.exposure, self.id_generator)
+        psf_stars, background, candidates = self._compute_psf()
         calibrate._measure_aperture_correction(self.exposure, psf_stars)
         stars = calibrate._find_stars(self.exposure, background, self.id_generator)
 
@@ -435,75 +482,82 @@ class CalibrateImageTaskRunQuantumTests(lsst.utils.tests.TestCase):
     """Tests of ``CalibrateImageTask.runQuantum``, which need a test butler,
     but do not need real images.
     """
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         instrument = "testCam"
         exposure0 = 101
         exposure1 = 102
         visit = 100101
         detector = 42
 
-        # Create a and populate a test butler for runQuantum tests.
-        self.repo_path = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
-        self.repo = butlerTests.makeTestRepo(self.repo_path.name)
+        # Create a and populate a test butler for runQuantum tests. The
+        # repository is shared; each test writes to its own collection.
+        cls.repo_path = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        cls.repo = butlerTests.makeTestRepo(cls.repo_path.name)
 
         # A complete instrument record is necessary for the id generator.
-        instrumentRecord = self.repo.dimensions["instrument"].RecordClass(
+        instrumentRecord = cls.repo.dimensions["instrument"].RecordClass(
             name=instrument, visit_max=1e6, exposure_max=1e6, detector_max=128,
             class_name="lsst.obs.base.instrument_tests.DummyCam",
         )
-        self.repo.registry.syncDimensionData("instrument", instrumentRecord)
+        cls.repo.registry.syncDimensionData("instrument", instrumentRecord)
 
         # dataIds for fake data
-        butlerTests.addDataIdValue(self.repo, "detector", detector)
-        butlerTests.addDataIdValue(self.repo, "exposure", exposure0)
-        butlerTests.addDataIdValue(self.repo, "exposure", exposure1)
-        butlerTests.addDataIdValue(self.repo, "visit", visit)
+        butlerTests.addDataIdValue(cls.repo, "detector", detector)
+        butlerTests.addDataIdValue(cls.repo, "exposure", exposure0)
+        butlerTests.addDataIdValue(cls.repo, "exposure", exposure1)
+        butlerTests.addDataIdValue(cls.repo, "visit", visit)
 
         # inputs
-        butlerTests.addDatasetType(self.repo, "postISRCCD", {"instrument", "exposure", "detector"},
+        butlerTests.addDatasetType(cls.repo, "postISRCCD", {"instrument", "exposure", "detector"},
                                    "ExposureF")
-        butlerTests.addDatasetType(self.repo, "gaia_dr3_20230707", {"htm7"}, "SimpleCatalog")
-        butlerTests.addDatasetType(self.repo, "ps1_pv3_3pi_20170110", {"htm7"}, "SimpleCatalog")
+        butlerTests.addDatasetType(cls.repo, "gaia_dr3_20230707", {"htm7"}, "SimpleCatalog")
+        butlerTests.addDatasetType(cls.repo, "ps1_pv3_3pi_20170110", {"htm7"}, "SimpleCatalog")
 
         # outputs
-        butlerTests.addDatasetType(self.repo, "initial_pvi", {"instrument", "visit", "detector"},
+        butlerTests.addDatasetType(cls.repo, "initial_pvi", {"instrument", "visit", "detector"},
                                    "ExposureF")
-        butlerTests.addDatasetType(self.repo, "initial_stars_footprints_detector",
+        butlerTests.addDatasetType(cls.repo, "initial_stars_footprints_detector",
                                    {"instrument", "visit", "detector"},
                                    "SourceCatalog")
-        butlerTests.addDatasetType(self.repo, "initial_stars_detector",
+        butlerTests.addDatasetType(cls.repo, "initial_stars_detector",
                                    {"instrument", "visit", "detector"},
                                    "ArrowAstropy")
-        butlerTests.addDatasetType(self.repo, "initial_photoCalib_detector",
+        butlerTests.addDatasetType(cls.repo, "initial_photoCalib_detector",
                                    {"instrument", "visit", "detector"},
                                    "PhotoCalib")
         # optional outputs
-        butlerTests.addDatasetType(self.repo, "initial_pvi_background", {"instrument", "visit", "detector"},
+        butlerTests.addDatasetType(cls.repo, "initial_pvi_background", {"instrument", "visit", "detector"},
                                    "Background")
-        butlerTests.addDatasetType(self.repo, "initial_psf_stars_footprints_detector",
+        butlerTests.addDatasetType(cls.repo, "initial_psf_stars_footprints_detector",
                                    {"instrument", "visit", "detector"},
                                    "SourceCatalog")
-        butlerTests.addDatasetType(self.repo, "initial_psf_stars_detector",
+        butlerTests.addDatasetType(cls.repo, "initial_psf_stars_detector",
                                    {"instrument", "visit", "detector"},
                                    "ArrowAstropy")
-        butlerTests.addDatasetType(self.repo,
+        butlerTests.addDatasetType(cls.repo,
                                    "initial_astrometry_match_detector",
                                    {"instrument", "visit", "detector"},
                                    "Catalog")
-        butlerTests.addDatasetType(self.repo,
+        butlerTests.addDatasetType(cls.repo,
                                    "initial_photometry_match_detector",
                                    {"instrument", "visit", "detector"},
                                    "Catalog")
 
         # dataIds
-        self.exposure0_id = self.repo.registry.expandDataId(
+        cls.exposure0_id = cls.repo.registry.expandDataId(
             {"instrument": instrument, "exposure": exposure0, "detector": detector})
-        self.exposure1_id = self.repo.registry.expandDataId(
+        cls.exposure1_id = cls.repo.registry.expandDataId(
             {"instrument": instrument, "exposure": exposure1, "detector": detector})
-        self.visit_id = self.repo.registry.expandDataId(
+        cls.visit_id = cls.repo.registry.expandDataId(
             {"instrument": instrument, "visit": visit, "detector": detector})
-        self.htm_id = self.repo.registry.expandDataId({"htm7": 42})
+        cls.htm_id = cls.repo.registry.expandDataId({"htm7": 42})
 
+    @classmethod
+    def tearDownClass(cls):
+        cls.repo_path.cleanup()
+
+    def setUp(self):
         # put empty data
         self.butler = butlerTests.makeTestCollection(self.repo)
         self.butler.put(afwImage.ExposureF(), "postISRCCD", self.exposure0_id)
@@ -511,9 +565,6 @@ class CalibrateImageTaskRunQuantumTests(lsst.utils.tests.TestCase):
         self.butler.put(afwTable.SimpleCatalog(), "gaia_dr3_20230707", self.htm_id)
         self.butler.put(afwTable.SimpleCatalog(), "ps1_pv3_3pi_20170110", self.htm_id)
 
-    def tearDown(self):
-        self.repo_path.cleanup()
-
     def test_runQuantum(self):
         task = CalibrateImageTask()
         lsst.pipe.base.testUtils.assertValidInitOutput(task)
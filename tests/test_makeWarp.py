@@ -20,6 +20,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import unittest
+from unittest import mock
 
 from typing import Self, Type
 
@@ -28,10 +29,10 @@ import numpy as np
 import lsst.utils.tests
 
 import lsst.afw.image
-from lsst.daf.butler import DataCoordinate, DimensionUniverse
+from lsst.daf.butler import DataCoordinate, DeferredDatasetHandle, DimensionUniverse
 from lsst.pipe.base import InMemoryDatasetHandle
 from lsst.pipe.tasks.make_direct_warp import MakeDirectWarpTask
-from lsst.pipe.tasks.makeWarp import (MakeWarpTask, MakeWarpConfig)
+from lsst.pipe.tasks.makeWarp import (MakeWarpTask, MakeWarpConfig, _iterPrefetched)
 from lsst.pipe.tasks.coaddBase import makeSkyInfo
 import lsst.skymap as skyMap
 from lsst.afw.detection import GaussianPsf
@@ -279,6 +280,37 @@ class MakeWarpTestCase(lsst.utils.tests.TestCase):
         self.assertMaskedImagesAlmostEqual(warp0.maskedImage, warp1.maskedImage, rtol=3e-7, atol=6e-6)
 
 
+class IterPrefetchedTestCase(lsst.utils.tests.TestCase):
+    """Test the calexp prefetching iterator."""
+
+    def _makeHandle(self, value):
+        handle = mock.Mock(spec=DeferredDatasetHandle)
+        handle.get.return_value = value
+        return handle
+
+    def testPrefetch(self):
+        for prefetch in (True, False):
+            with self.subTest(prefetch=prefetch):
+                handles = [self._makeHandle(i) for i in range(4)]
+                inputs = handles[:2] + ["passthrough"] + handles[2:]
+                self.assertEqual(list(_iterPrefetched(inputs, prefetch=prefetch)),
+                                 [0, 1, "passthrough", 2, 3])
+                for handle in handles:
+                    handle.get.assert_called_once_with()
+
+    def testSerialReadsOnDemand(self):
+        handles = [self._makeHandle(i) for i in range(3)]
+        iterator = _iterPrefetched(handles, prefetch=False)
+        self.assertEqual(next(iterator), 0)
+        handles[0].get.assert_called_once_with()
+        handles[1].get.assert_not_called()
+
+    def testEmpty(self):
+        for prefetch in (True, False):
+            with self.subTest(prefetch=prefetch):
+                self.assertEqual(list(_iterPrefetched([], prefetch=prefetch)), [])
+
+
 def setup_module(module):
     lsst.utils.tests.init()
 
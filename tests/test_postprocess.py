@@ -0,0 +1,167 @@
+# This file is part of pipe_tasks.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests of the catalog conversion and merging in postprocess.py."""
+
+import logging
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import lsst.afw.table as afwTable
+import lsst.geom as geom
+import lsst.utils.tests
+from lsst.pipe.base import InMemoryDatasetHandle
+from lsst.pipe.tasks.postprocess import (WriteForcedSourceTableTask, _catalogToDataFrame,
+                                         _concatenateDeferred)
+
+
+class CatalogToDataFrameTestCase(lsst.utils.tests.TestCase):
+    """Test that the direct catalog conversion matches the astropy one."""
+
+    def setUp(self):
+        self.schema = afwTable.SourceTable.makeMinimalSchema()
+        self.flagKey = self.schema.addField("test_flag", type="Flag", doc="A flag.")
+        self.nameKey = self.schema.addField("test_name", type=str, size=8, doc="A string.")
+        self.fluxKey = self.schema.addField("test_flux", type=np.float64, doc="A flux.")
+        self.catalog = afwTable.SourceCatalog(self.schema)
+        for i in range(5):
+            record = self.catalog.addNew()
+            record.set(self.flagKey, i % 2 == 0)
+            record.set(self.nameKey, f"src{i}")
+            record.set(self.fluxKey, 1.5*i)
+            record.setCoord(geom.SpherePoint(10.0 + i, -5.0 + i, geom.degrees))
+
+    def _assertMatchesAstropy(self, catalog, **kwargs):
+        """Check the conversion of ``catalog`` against astropy's, computed
+        on a contiguous copy.
+        """
+        expected = catalog.copy(deep=True).asAstropy().to_pandas().set_index(
+            kwargs.get("index", "id"), drop=kwargs.get("drop", True))
+        if kwargs.get("sort", False):
+            expected = expected.reindex(sorted(expected.columns), axis=1)
+        pd.testing.assert_frame_equal(_catalogToDataFrame(catalog, **kwargs), expected)
+
+    def testContiguous(self):
+        self.assertTrue(self.catalog.isContiguous())
+        self._assertMatchesAstropy(self.catalog)
+        self._assertMatchesAstropy(self.catalog, index="id", drop=False, sort=True)
+
+    def testNonContiguous(self):
+        catalog = afwTable.SourceCatalog(self.catalog.table)
+        for record in reversed(list(self.catalog)):
+            catalog.append(record)
+        self.assertFalse(catalog.isContiguous())
+        self._assertMatchesAstropy(catalog)
+
+    def testEmpty(self):
+        catalog = afwTable.SourceCatalog(self.schema)
+        self._assertMatchesAstropy(catalog)
+        df = _catalogToDataFrame(catalog)
+        self.assertEqual(len(df), 0)
+        self.assertEqual(df["test_name"].dtype, object)
+
+
+class ConcatenateDeferredTestCase(lsst.utils.tests.TestCase):
+    """Test that streaming concatenation matches `pandas.concat`."""
+
+    def setUp(self):
+        self.log = logging.getLogger("lsst.pipe.tasks.test_postprocess")
+        rng = np.random.Generator(np.random.PCG64(12345))
+        self.dfs = []
+        start = 0
+        for nRows in (5, 0, 3):
+            index = pd.Index(np.arange(start, start + nRows, dtype=np.int64), name="objectId")
+            self.dfs.append(pd.DataFrame({"flux": rng.normal(size=nRows),
+                                          "flag": rng.normal(size=nRows) > 0,
+                                          "band": ["r"]*nRows},
+                                         index=index))
+            start += nRows
+
+    def _makeHandles(self, dfs):
+        return [InMemoryDatasetHandle(df, storageClass="DataFrame") for df in dfs]
+
+    def testMatchingSchemas(self):
+        result = _concatenateDeferred(self._makeHandles(self.dfs), self.log)
+        pd.testing.assert_frame_equal(result, pd.concat(self.dfs))
+
+    def testDifferingSchemas(self):
+        self.dfs[2]["extra"] = np.ones(len(self.dfs[2]))
+        with self.assertLogs(self.log, level="INFO"):
+            result = _concatenateDeferred(self._makeHandles(self.dfs), self.log)
+        pd.testing.assert_frame_equal(result, pd.concat(self.dfs))
+
+    def testExtensionDtype(self):
+        for df in self.dfs:
+            df["count"] = pd.array(np.arange(len(df)), dtype="Int64")
+        with self.assertLogs(self.log, level="INFO"):
+            result = _concatenateDeferred(self._makeHandles(self.dfs), self.log)
+        pd.testing.assert_frame_equal(result, pd.concat(self.dfs))
+
+
+class WriteForcedSourceTableTestCase(lsst.utils.tests.TestCase):
+    """Test the merging of calexp and diff forced source catalogs."""
+
+    def _makeCatalog(self, objectIds):
+        schema = afwTable.SourceTable.makeMinimalSchema()
+        objectIdKey = schema.addField("objectId", type=np.int64, doc="Reference object id.")
+        fluxKey = schema.addField("test_flux", type=np.float64, doc="A flux.")
+        catalog = afwTable.SourceCatalog(schema)
+        for i, objectId in enumerate(objectIds):
+            record = catalog.addNew()
+            record.set(objectIdKey, objectId)
+            record.set(fluxKey, float(objectId))
+            record.setCoord(geom.SpherePoint(10.0 + i, -5.0 + i, geom.degrees))
+        return catalog
+
+    def testMismatchedIds(self):
+        """Objects only in the diff catalog are dropped, and objects missing
+        from it get null diff columns.
+        """
+        task = WriteForcedSourceTableTask()
+        result = task.run(self._makeCatalog([10, 11, 12, 13]), self._makeCatalog([11, 12, 14]),
+                          visit=5, detector=3, band="r")
+        catalog = result.outputCatalog
+        np.testing.assert_array_equal(catalog.index, [10, 11, 12, 13])
+        np.testing.assert_array_equal(catalog[("calexp", "test_flux")], [10.0, 11.0, 12.0, 13.0])
+        np.testing.assert_array_equal(catalog[("diff", "test_flux")], [np.nan, 11.0, 12.0, np.nan])
+
+    def testDuplicateIds(self):
+        """Duplicate ids in the diff catalog are joined rather than rejected.
+        """
+        task = WriteForcedSourceTableTask()
+        result = task.run(self._makeCatalog([10, 11]), self._makeCatalog([11, 11]),
+                          visit=5, detector=3, band="r")
+        np.testing.assert_array_equal(result.outputCatalog.index, [10, 11, 11])
+
+
+def setup_module(module):
+    lsst.utils.tests.init()
+
+
+class MemoryTestCase(lsst.utils.tests.MemoryTestCase):
+    pass
+
+
+if __name__ == "__main__":
+    lsst.utils.tests.init()
+    unittest.main()
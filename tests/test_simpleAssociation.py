@@ -28,7 +28,7 @@ import lsst.afw.table as afwTable
 import lsst.geom as geom
 import lsst.utils.tests
 from lsst.pipe.tasks.associationUtils import toIndex
-from lsst.pipe.tasks.simpleAssociation import SimpleAssociationTask
+from lsst.pipe.tasks.simpleAssociation import SimpleAssociationTask, _IndexBuffer
 
 
 class TestSimpleAssociation(lsst.utils.tests.TestCase):
@@ -221,6 +221,18 @@ class TestSimpleAssociation(lsst.utils.tests.TestCase):
         self.assertEqual(matchResult.matches[0], 2)
         self.assertEqual(matchResult.matches[1], 3)
 
+    def testIndexBufferGrowth(self):
+        """Test that the index buffer grows from any initial capacity.
+        """
+        for capacity in (0, 1, 3):
+            buffer = _IndexBuffer(capacity=capacity)
+            for value in range(10):
+                buffer.append(value)
+            self.assertEqual(len(buffer), 10)
+            np.testing.assert_array_equal(np.asarray(buffer), np.arange(10))
+            buffer[2] = -1
+            self.assertEqual(buffer[2], -1)
+
 
 def setup_module(module):
     lsst.utils.tests.init()